@@ -12,10 +12,17 @@ Key strategy: Start slow, gradually increase, immediately back off on errors.
 import sys
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import argparse
 import signal
 import json
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Proton Drive specific limits
 DEFAULT_TRANSFERS = 2  # Very conservative start
 MIN_TRANSFERS = 1
@@ -27,30 +34,40 @@ MAX_TPS = 8
 ERROR_BACKOFF = 0.5  # Cut in half on error
 SEVERE_ERROR_BACKOFF = 0.25  # Quarter on severe errors (429)
 
-def get_stats(base_url):
+# Poll interval (seconds): drops right after errors, grows while stable
+POLL_INTERVAL = 10
+MIN_POLL_INTERVAL = 2
+MAX_POLL_INTERVAL = 30
+POLL_INTERVAL_STEP = 2
+
+# One keep-alive connection to the rclone RC server for the whole run
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0))
+
+def get_stats(stats_url):
     try:
-        r = requests.post(f"{base_url}/core/stats", timeout=5)
+        r = SESSION.post(stats_url, timeout=5)
         if r.status_code == 200:
-            return r.json()
-    except:
+            return _json_loads(r.content)
+    except (requests.RequestException, ValueError):
         pass
     return None
 
-def set_transfers(base_url, count):
+def set_transfers(opts_url, count):
     try:
         payload = {"main": {"Transfers": int(count)}}
-        requests.post(f"{base_url}/options/set", json=payload, timeout=5)
+        SESSION.post(opts_url, json=payload, timeout=5)
         return True
-    except:
+    except requests.RequestException:
         return False
 
-def set_tps_limit(base_url, tps):
+def set_tps_limit(opts_url, tps):
     """Set transactions per second limit"""
     try:
         payload = {"main": {"TPSLimit": float(tps), "TPSLimitBurst": int(tps * 2)}}
-        requests.post(f"{base_url}/options/set", json=payload, timeout=5)
+        SESSION.post(opts_url, json=payload, timeout=5)
         return True
-    except:
+    except requests.RequestException:
         return False
 
 def is_rate_limit_error(last_error):
@@ -70,26 +87,29 @@ def main():
     args = parser.parse_args()
 
     base_url = f"http://127.0.0.1:{args.port}"
+    stats_url = f"{base_url}/core/stats"
+    opts_url = f"{base_url}/options/set"
     
     # Start at minimum safe speed
     current_transfers = max(MIN_TRANSFERS, min(args.init_transfers, args.max_transfers))
     current_tps = MIN_TPS
     
     # Set initial conservative speed
-    set_transfers(base_url, current_transfers)
-    set_tps_limit(base_url, current_tps)
+    set_transfers(opts_url, current_transfers)
+    set_tps_limit(opts_url, current_tps)
     print(f"[Monitor] Starting with {current_transfers} transfers, {current_tps} TPS")
 
     last_error_count = 0
     last_error_msg = ""
-    stable_intervals = 0
+    stable_seconds = 0
     bytes_last = 0
-    stuck_count = 0
+    stuck_seconds = 0
+    sleep_s = POLL_INTERVAL
     
     # Wait for rclone to start
     print(f"[Monitor] Waiting for rclone on port {args.port}...")
     for _ in range(30):
-        stats = get_stats(base_url)
+        stats = get_stats(stats_url)
         if stats:
             print("[Monitor] Connected to rclone.")
             last_error_count = stats.get("errors", 0)
@@ -101,8 +121,8 @@ def main():
         return
     
     while True:
-        time.sleep(10)
-        stats = get_stats(base_url)
+        time.sleep(sleep_s)
+        stats = get_stats(stats_url)
         if not stats:
             print("[Monitor] Rclone unavailable. Exiting.")
             break
@@ -140,50 +160,55 @@ def main():
             
             # Apply backoff
             if new_transfers != current_transfers or new_tps != current_tps:
-                set_transfers(base_url, new_transfers)
-                set_tps_limit(base_url, new_tps)
+                set_transfers(opts_url, new_transfers)
+                set_tps_limit(opts_url, new_tps)
                 current_transfers = new_transfers
                 current_tps = new_tps
                 print(f"[Monitor] Backed off to {current_transfers} transfers, {current_tps:.1f} TPS")
             
             last_error_count = curr_errors
-            stable_intervals = 0
-            stuck_count = 0
+            stable_seconds = 0
+            stuck_seconds = 0
+            # Poll quickly while errors are happening so we react within seconds
+            sleep_s = MIN_POLL_INTERVAL
             
         else:
             # No new errors
-            stable_intervals += 1
+            stable_seconds += sleep_s
             
             # Check if we're stuck (no progress)
             if curr_bytes == bytes_last and speed < 100:
-                stuck_count += 1
-                if stuck_count > 6:  # Stuck for 1 minute
+                stuck_seconds += sleep_s
+                if stuck_seconds > 60:  # Stuck for 1 minute
                     print("[Monitor] Progress stalled. Reducing load.")
                     new_transfers = max(MIN_TRANSFERS, current_transfers - 1)
-                    set_transfers(base_url, new_transfers)
+                    set_transfers(opts_url, new_transfers)
                     current_transfers = new_transfers
-                    stuck_count = 0
+                    stuck_seconds = 0
             else:
-                stuck_count = 0
+                stuck_seconds = 0
             
             bytes_last = curr_bytes
             
             # Gradual speed increase after sustained stability
-            if stable_intervals >= 12:  # 2 minutes stable
+            if stable_seconds >= 120:  # 2 minutes stable
                 # Slowly increase
                 if current_transfers < args.max_transfers:
                     new_transfers = current_transfers + 1
-                    if set_transfers(base_url, new_transfers):
+                    if set_transfers(opts_url, new_transfers):
                         current_transfers = new_transfers
                         print(f"[Monitor] Stable. Increasing to {current_transfers} transfers.")
-                        stable_intervals = 0
+                        stable_seconds = 0
                         
                 elif current_tps < MAX_TPS:
                     new_tps = min(MAX_TPS, current_tps + 0.5)
-                    if set_tps_limit(base_url, new_tps):
+                    if set_tps_limit(opts_url, new_tps):
                         current_tps = new_tps
                         print(f"[Monitor] Stable. Increasing TPS to {current_tps:.1f}")
-                        stable_intervals = 0
+                        stable_seconds = 0
+            
+            # Back off polling while things stay calm
+            sleep_s = min(MAX_POLL_INTERVAL, sleep_s + POLL_INTERVAL_STEP)
 
 if __name__ == "__main__":
     main()
@@ -18,6 +18,7 @@
 #include <cctype>
 #include <cstdio>
 #include <set>
+#include <algorithm>
 #include <unistd.h>
 #include <limits.h>
 
@@ -36,6 +37,13 @@ using AppWindowHelpers::format_file_size;
 using AppWindowHelpers::safe_exists;
 using AppWindowHelpers::safe_is_directory;
 
+// Maximum number of lines kept in the logs panel (older lines are trimmed)
+static const int MAX_LOG_LINES = 2000;
+// Queued log text is flushed to the panel at most this often
+static const guint LOG_FLUSH_INTERVAL_MS = 50;
+// Cap on queued-but-unflushed log text
+static const size_t MAX_PENDING_LOG_BYTES = 256 * 1024;
+
 // CSS styling for the drop zone and modern UI (GTK4 compatible)
 static const char* APP_CSS = R"(
 /* Drop zone styling */
@@ -749,6 +757,13 @@ bool AppWindow::initialize() {
         return G_SOURCE_CONTINUE;
     }, this);
     
+    // Re-check service status as soon as the window regains focus
+    g_signal_connect(window_, "notify::is-active", G_CALLBACK(+[](GObject* obj, GParamSpec*, gpointer data) {
+        if (gtk_window_is_active(GTK_WINDOW(obj))) {
+            static_cast<AppWindow*>(data)->poll_status(true);
+        }
+    }), this);
+    
     // Start sync activity polling (every 1 second for responsive UI)
     g_timeout_add(1000, [](gpointer data) -> gboolean {
         auto* self = static_cast<AppWindow*>(data);
@@ -1494,6 +1509,7 @@ void AppWindow::build_window() {
     gtk_box_append(GTK_BOX(service_section), service_label);
     
     service_status_label_ = gtk_label_new("Checking...");
+    shown_service_jobs_ = -1;  // New label: force the next status update to render
     gtk_label_set_xalign(GTK_LABEL(service_status_label_), 0);
     gtk_box_append(GTK_BOX(service_section), service_status_label_);
     
@@ -1975,20 +1991,34 @@ void AppWindow::handle_cloud_drop(const std::vector<std::string>& local_paths, c
 }
 
 // Button handlers
-void AppWindow::poll_status() {
-    // Check if any sync job timers are active
-    std::string output = exec_command("systemctl --user list-units 'proton-drive-job-*.timer' --state=active --no-legend 2>/dev/null | wc -l");
-    
-    // Trim whitespace
-    output.erase(0, output.find_first_not_of(" \t\n"));
-    output.erase(output.find_last_not_of(" \t\n") + 1);
-    
-    int active_timers = 0;
-    try {
-        active_timers = std::stoi(output);
-    } catch (...) {}
-    
-    update_service_status(active_timers > 0);
+void AppWindow::poll_status(bool force_service_check) {
+    // Check if any sync job timers are active. This spawns systemctl, so while
+    // unforced checks keep returning the same count the interval backs off
+    // from 2s up to 30s. A changed count or a forced check (user action,
+    // job add/delete, window focus) resets it to 2s.
+    auto now = std::chrono::steady_clock::now();
+    if (force_service_check || now >= next_service_check_) {
+        std::string output = exec_command("systemctl --user list-units 'proton-drive-job-*.timer' --state=active --no-legend 2>/dev/null | wc -l");
+        
+        // Trim whitespace
+        output.erase(0, output.find_first_not_of(" \t\n"));
+        output.erase(output.find_last_not_of(" \t\n") + 1);
+        
+        int active_timers = 0;
+        try {
+            active_timers = std::stoi(output);
+        } catch (...) {}
+        
+        if (force_service_check || active_timers != last_active_timers_) {
+            last_active_timers_ = active_timers;
+            service_check_interval_s_ = 2;
+        } else {
+            service_check_interval_s_ = std::min(service_check_interval_s_ * 2, 30);
+        }
+        next_service_check_ = now + std::chrono::seconds(service_check_interval_s_);
+        
+        update_service_status(active_timers);
+    }
     
     // Update index status in Settings if visible
     if (index_status_label_) {
@@ -2060,6 +2090,14 @@ void AppWindow::shutdown() {
         Logger::info("[AppWindow] Cloud monitor stopped");
     }
     
+    {
+        std::lock_guard<std::mutex> lock(log_mutex_);
+        if (log_flush_id_ > 0) {
+            g_source_remove(log_flush_id_);
+            log_flush_id_ = 0;
+        }
+    }
+    
     Logger::info("[AppWindow] Shutdown complete");
 }
 
@@ -2072,26 +2110,85 @@ void AppWindow::update_sync_progress(const std::string& file,
 }
 
 void AppWindow::append_log(const std::string& message) {
-    if (!logs_view_) return;
+    // May run on a worker thread: only queue text here. logs_view_ is
+    // checked and written on the main loop in flush_log().
     
     // Add timestamp
     time_t now = time(nullptr);
+    struct tm tm_buf;
     char time_buf[32];
-    strftime(time_buf, sizeof(time_buf), "%H:%M:%S", localtime(&now));
+    strftime(time_buf, sizeof(time_buf), "%H:%M:%S", localtime_r(&now, &tm_buf));
+    
+    {
+        std::lock_guard<std::mutex> lock(log_mutex_);
+        pending_log_ += time_buf;
+        pending_log_ += ' ';
+        pending_log_ += message;
+        pending_log_ += '\n';
+        
+        // If the UI falls behind a chatty worker, drop the oldest queued lines
+        // rather than letting the backlog grow without bound
+        if (pending_log_.size() > MAX_PENDING_LOG_BYTES) {
+            size_t cut = pending_log_.find('\n', pending_log_.size() / 2);
+            if (cut != std::string::npos) {
+                dropped_log_lines_ += std::count(pending_log_.begin(), pending_log_.begin() + cut + 1, '\n');
+                pending_log_.erase(0, cut + 1);
+            }
+        }
+        
+        // Coalesce bursts (from any thread) into at most one buffer insert +
+        // scroll per LOG_FLUSH_INTERVAL_MS
+        if (log_flush_id_ == 0) {
+            log_flush_id_ = g_timeout_add(LOG_FLUSH_INTERVAL_MS, +[](gpointer data) -> gboolean {
+                static_cast<AppWindow*>(data)->flush_log();
+                return G_SOURCE_REMOVE;
+            }, this);
+        }
+    }
     
-    std::string full_msg = std::string(time_buf) + " " + message + "\n";
+    Logger::info("[AppWindow] " + message);
+}
+
+void AppWindow::flush_log() {
+    std::string text;
+    {
+        std::lock_guard<std::mutex> lock(log_mutex_);
+        log_flush_id_ = 0;
+        text.swap(pending_log_);
+        // Dropped lines always come from the front of the queue, so the
+        // marker belongs right before what's left of it
+        if (dropped_log_lines_ > 0) {
+            text.insert(0, "... " + std::to_string(dropped_log_lines_) + " log lines dropped ...\n");
+            dropped_log_lines_ = 0;
+        }
+    }
+    if (!logs_view_ || text.empty()) return;
     
     GtkTextBuffer* buffer = gtk_text_view_get_buffer(GTK_TEXT_VIEW(logs_view_));
     GtkTextIter end;
     gtk_text_buffer_get_end_iter(buffer, &end);
-    gtk_text_buffer_insert(buffer, &end, full_msg.c_str(), -1);
+    gtk_text_buffer_insert(buffer, &end, text.data(), static_cast<int>(text.size()));
+    
+    // Trim the oldest lines so the buffer (and its layout cost) stays bounded.
+    // Every flushed chunk ends in '\n', so GTK also counts the empty line
+    // after it; leave that out of the log line count.
+    int log_lines = gtk_text_buffer_get_line_count(buffer) - 1;
+    if (log_lines > MAX_LOG_LINES) {
+        GtkTextIter start, cut;
+        gtk_text_buffer_get_start_iter(buffer, &start);
+        gtk_text_buffer_get_iter_at_line(buffer, &cut, log_lines - MAX_LOG_LINES);
+        gtk_text_buffer_delete(buffer, &start, &cut);
+    }
     
-    // Auto-scroll
+    // Auto-scroll (reuse one named mark instead of creating a new one per line)
     gtk_text_buffer_get_end_iter(buffer, &end);
-    GtkTextMark* mark = gtk_text_buffer_create_mark(buffer, nullptr, &end, FALSE);
+    GtkTextMark* mark = gtk_text_buffer_get_mark(buffer, "log-end");
+    if (mark) {
+        gtk_text_buffer_move_mark(buffer, mark, &end);
+    } else {
+        mark = gtk_text_buffer_create_mark(buffer, "log-end", &end, FALSE);
+    }
     gtk_text_view_scroll_to_mark(GTK_TEXT_VIEW(logs_view_), mark, 0.0, TRUE, 0.0, 1.0);
-    
-    Logger::info("[AppWindow] " + message);
 }
 
 void AppWindow::show_toast(const std::string& message, int duration_ms) {
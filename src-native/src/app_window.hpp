@@ -70,7 +70,8 @@ public:
                               const std::string& transferred);
 
     /**
-     * Append log message
+     * Append log message (safe to call from any thread; the panel is
+     * updated in batches on the main loop)
      */
     void append_log(const std::string& message);
 
@@ -85,9 +86,9 @@ public:
     void refresh_sync_jobs();
 
     /**
-     * Update service status display
+     * Update service status display (no-op if the job count is unchanged)
      */
-    void update_service_status(bool is_running);
+    void update_service_status(int active_jobs);
 
     /**
      * Get cloud tree widget for external callbacks
@@ -219,6 +220,11 @@ private:
     GtkWidget* logs_view_ = nullptr;
     GtkWidget* logs_scroll_ = nullptr;
     GtkWidget* logs_toggle_ = nullptr;
+    std::mutex log_mutex_;       // Protects pending_log_, dropped_log_lines_ and log_flush_id_
+    std::string pending_log_;    // Lines waiting for the next flush
+    size_t dropped_log_lines_ = 0;  // Lines discarded from pending_log_ since the last flush
+    guint log_flush_id_ = 0;     // Timeout source for flush_log(), 0 if none scheduled
+    void flush_log();
     
     // Transfer progress popup
     GtkWidget* transfer_popup_ = nullptr;
@@ -311,9 +317,15 @@ private:
     void monitor_cloud_changes();  // Check for new/changed files in synced folders
     
     // Status polling
-    void poll_status();
+    void poll_status(bool force_service_check = false);
     void poll_sync_activity();
     
+    // systemctl timer check backoff: grows while the result is unchanged
+    int last_active_timers_ = -1;
+    int service_check_interval_s_ = 2;
+    std::chrono::steady_clock::time_point next_service_check_{};
+    int shown_service_jobs_ = -1;  // Job count currently rendered in the status label
+    
     // Conflict resolution UI
     void refresh_conflicts();
     void show_conflict_resolution(const std::string& conflict_path);
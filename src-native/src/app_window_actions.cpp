@@ -319,7 +319,7 @@ void AppWindow::on_start_clicked() {
     }).detach();
     
     g_timeout_add(1000, [](gpointer data) -> gboolean {
-        static_cast<AppWindow*>(data)->poll_status();
+        static_cast<AppWindow*>(data)->poll_status(true);
         return G_SOURCE_REMOVE;
     }, this);
 }
@@ -332,7 +332,7 @@ void AppWindow::on_stop_clicked() {
     }).detach();
     
     g_timeout_add(1000, [](gpointer data) -> gboolean {
-        static_cast<AppWindow*>(data)->poll_status();
+        static_cast<AppWindow*>(data)->poll_status(true);
         return G_SOURCE_REMOVE;
     }, this);
 }
@@ -825,6 +825,7 @@ void AppWindow::perform_sync_after_conflict_resolution(const std::string& local_
             SyncManager::getInstance().load_jobs();
             d->self->refresh_sync_jobs();
             d->self->refresh_cloud_files();
+            d->self->poll_status(true);  // New job timer: refresh service status now
             
             delete d;
             return G_SOURCE_REMOVE;
@@ -1145,10 +1146,13 @@ void AppWindow::on_edit_profile_clicked(const std::string& profile_name) {
         
         data->window->append_log("[Profile] Updating profile: " + data->profile_name);
         
-        // Delete old profile
-        run_rclone("config delete " + data->profile_name);
+        // `config create proton` overwrites an existing "proton" remote in
+        // place, so only a differently named profile needs deleting first
+        if (data->profile_name != "proton") {
+            run_rclone("config delete " + data->profile_name);
+        }
         
-        // Create new profile with same name
+        // (Re)create the proton profile
         std::string output;
         std::string error_message;
         bool ok = run_rclone_config_create(
@@ -1504,6 +1508,7 @@ GtkWidget* AppWindow::build_service_section() {
     
     // Status label
     service_status_label_ = gtk_label_new("Checking...");
+    shown_service_jobs_ = -1;  // New label: force the next status update to render
     gtk_label_set_xalign(GTK_LABEL(service_status_label_), 0);
     gtk_box_append(GTK_BOX(section), service_status_label_);
     
@@ -14,6 +14,8 @@
 #include <array>
 #include <memory>
 #include <vector>
+#include <mutex>
+#include <chrono>
 #include <unistd.h>
 #include <limits.h>
 
@@ -38,7 +40,7 @@ std::string shell_escape(const std::string& arg) {
     return result;
 }
 
-std::string get_rclone_path() {
+static std::string resolve_rclone_path() {
     // Check for AppImage bundled rclone first
     const char* appdir = std::getenv("APPDIR");
     if (appdir) {
@@ -81,60 +83,71 @@ std::string get_rclone_path() {
     return "rclone";
 }
 
+std::string get_rclone_path() {
+    // The binary location cannot change while we run; resolve it only once
+    static const std::string path = resolve_rclone_path();
+    return path;
+}
+
+// Drain a popen() stream in large chunks. Callers want the whole output,
+// so there's no point splitting it into 128-byte fgets() lines (lsjson
+// listings can be several MB).
+static std::string read_pipe(FILE* pipe) {
+    std::array<char, 65536> buffer;
+    std::string result;
+    size_t n;
+    while ((n = fread(buffer.data(), 1, buffer.size(), pipe)) > 0) {
+        result.append(buffer.data(), n);
+    }
+    return result;
+}
+
 std::string exec_rclone(const std::string& args) {
     std::string rclone_path = get_rclone_path();
     std::string cmd = rclone_path + " " + args + " 2>/dev/null";
-    Logger::debug("[rclone] Executing: " + cmd);
-    std::array<char, 128> buffer;
-    std::string result;
+    if (Logger::is_enabled(LogLevel::DEBUG)) {
+        Logger::debug("[rclone] Executing: " + cmd);
+    }
     std::unique_ptr<FILE, decltype(&pclose)> pipe(popen(cmd.c_str(), "r"), pclose);
     if (!pipe) {
         return "";
     }
-    while (fgets(buffer.data(), buffer.size(), pipe.get()) != nullptr) {
-        result += buffer.data();
-    }
-    return result;
+    return read_pipe(pipe.get());
 }
 
 std::string exec_rclone_with_timeout(const std::string& args, int timeout_seconds) {
     std::string rclone_path = get_rclone_path();
     std::string cmd = "timeout " + std::to_string(timeout_seconds) + " " + 
                       rclone_path + " " + args + " 2>/dev/null";
-    Logger::debug("[rclone] Executing (timeout " + std::to_string(timeout_seconds) + "s): " + cmd);
-    std::array<char, 128> buffer;
-    std::string result;
+    if (Logger::is_enabled(LogLevel::DEBUG)) {
+        Logger::debug("[rclone] Executing (timeout " + std::to_string(timeout_seconds) + "s): " + cmd);
+    }
     std::unique_ptr<FILE, decltype(&pclose)> pipe(popen(cmd.c_str(), "r"), pclose);
     if (!pipe) {
         Logger::warn("[rclone] popen failed for timed command");
         return "";
     }
-    while (fgets(buffer.data(), buffer.size(), pipe.get()) != nullptr) {
-        result += buffer.data();
-    }
-    return result;
+    return read_pipe(pipe.get());
 }
 
 int run_rclone(const std::string& args) {
     std::string rclone_path = get_rclone_path();
-    std::string cmd = rclone_path + " " + args + " 2>/dev/null";
-    Logger::debug("[rclone] Running: " + cmd);
+    // Only the exit status is used, so discard stdout as well as stderr
+    std::string cmd = rclone_path + " " + args + " >/dev/null 2>&1";
+    if (Logger::is_enabled(LogLevel::DEBUG)) {
+        Logger::debug("[rclone] Running: " + cmd);
+    }
     return std::system(cmd.c_str());
 }
 
 std::string exec_command(const char* cmd) {
     try {
-        std::array<char, 128> buffer;
-        std::string result;
         std::unique_ptr<FILE, decltype(&pclose)> pipe(popen(cmd, "r"), pclose);
         if (!pipe) {
             Logger::warn("[exec_command] popen failed for command");
             return "";
         }
-        while (fgets(buffer.data(), buffer.size(), pipe.get()) != nullptr) {
-            result += buffer.data();
-        }
-        return result;
+        return read_pipe(pipe.get());
     } catch (const std::exception& e) {
         Logger::error("[exec_command] Exception: " + std::string(e.what()));
         return "";
@@ -297,8 +310,68 @@ void ensure_valid_cwd_for_shell() {
     }
 }
 
+// Short-lived cache of the remote list so startup and dialog checks
+// don't each re-read the config
+static std::mutex remotes_cache_mutex;
+static std::string remotes_cache;
+static std::chrono::steady_clock::time_point remotes_cache_time;
+static bool remotes_cache_valid = false;
+static const auto REMOTES_CACHE_TTL = std::chrono::seconds(5);
+
+// Read remote names straight from rclone.conf section headers, formatted
+// like `rclone listremotes`. Returns false if the file is missing or
+// encrypted so the caller can fall back to asking rclone.
+static bool read_remotes_from_config(std::string& out) {
+    std::string path;
+    const char* env_path = std::getenv("RCLONE_CONFIG");
+    const char* xdg = std::getenv("XDG_CONFIG_HOME");
+    const char* home = std::getenv("HOME");
+    if (env_path && *env_path) {
+        path = env_path;
+    } else if (xdg && *xdg) {
+        path = std::string(xdg) + "/rclone/rclone.conf";
+    } else if (home) {
+        path = std::string(home) + "/.config/rclone/rclone.conf";
+    } else {
+        return false;
+    }
+    
+    std::ifstream file(path);
+    if (!file) return false;
+    
+    out.clear();
+    std::string line;
+    while (std::getline(file, line)) {
+        if (line.rfind("RCLONE_ENCRYPT_", 0) == 0) return false;
+        size_t start = line.find_first_not_of(" \t");
+        if (start == std::string::npos || line[start] != '[') continue;
+        size_t end = line.find(']', start);
+        if (end == std::string::npos || end == start + 1) continue;
+        out += line.substr(start + 1, end - start - 1) + ":\n";
+    }
+    return true;
+}
+
+std::string list_rclone_remotes() {
+    std::lock_guard<std::mutex> lock(remotes_cache_mutex);
+    auto now = std::chrono::steady_clock::now();
+    if (!remotes_cache_valid || now - remotes_cache_time >= REMOTES_CACHE_TTL) {
+        if (!read_remotes_from_config(remotes_cache)) {
+            remotes_cache = exec_rclone("listremotes");
+        }
+        remotes_cache_time = now;
+        remotes_cache_valid = true;
+    }
+    return remotes_cache;
+}
+
+void invalidate_rclone_remotes_cache() {
+    std::lock_guard<std::mutex> lock(remotes_cache_mutex);
+    remotes_cache_valid = false;
+}
+
 bool has_rclone_profile() {
-    std::string remotes = exec_rclone("listremotes");
+    std::string remotes = list_rclone_remotes();
     return remotes.find("proton:") != std::string::npos;
 }
 
@@ -355,6 +428,9 @@ bool run_rclone_config_create(const std::string& username,
 
     if (stdout_buf) g_free(stdout_buf);
     if (stderr_buf) g_free(stderr_buf);
+    
+    // The remote list may have changed whether or not rclone succeeded
+    invalidate_rclone_remotes_cache();
 
     if (!ok) {
         Logger::error("[ProfileConfig] Failed to spawn rclone");
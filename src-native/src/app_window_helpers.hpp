@@ -30,7 +30,7 @@ std::string exec_rclone(const std::string& args);
 std::string exec_rclone_with_timeout(const std::string& args, int timeout_seconds);
 
 /**
- * Run rclone command without capturing output
+ * Run rclone command without capturing output (stdout/stderr discarded)
  */
 int run_rclone(const std::string& args);
 
@@ -55,6 +55,17 @@ std::pair<std::string, std::string> get_sync_status_for_path(const std::string&
  */
 void ensure_valid_cwd_for_shell();
 
+/**
+ * Get configured remotes in `rclone listremotes` format (cached for a few
+ * seconds). Reads rclone.conf directly and only runs rclone as a fallback.
+ */
+std::string list_rclone_remotes();
+
+/**
+ * Drop the cached remote list after a profile is created or deleted
+ */
+void invalidate_rclone_remotes_cache();
+
 /**
  * Check if rclone proton profile exists
  */
@@ -29,7 +29,7 @@ void AppWindow::refresh_profiles() {
     
     // Load profiles from rclone using correct path
     try {
-        std::string remotes = exec_rclone("listremotes");
+        std::string remotes = list_rclone_remotes();
         Logger::info("[Profiles] rclone listremotes returned: " + remotes);
         std::stringstream ss(remotes);
         std::string remote;
@@ -71,6 +71,7 @@ void AppWindow::refresh_profiles() {
                 const char* name = static_cast<const char*>(g_object_get_data(G_OBJECT(btn), "profile_name"));
                 if (name) {
                     run_rclone("config delete " + std::string(name));
+                    invalidate_rclone_remotes_cache();
                     AppWindow::getInstance().refresh_profiles();
                 }
             }), nullptr);
@@ -697,19 +698,18 @@ void AppWindow::refresh_devices() {
     }
 }
 
-void AppWindow::update_service_status(bool is_running) {
+void AppWindow::update_service_status(int active_jobs) {
     if (!service_status_label_) return;
     
+    // Skip redundant redraws when polling reports the same state again
+    if (active_jobs == shown_service_jobs_) return;
+    shown_service_jobs_ = active_jobs;
+    
     gtk_widget_remove_css_class(service_status_label_, "service-status-active");
     gtk_widget_remove_css_class(service_status_label_, "service-status-inactive");
     
-    if (is_running) {
-        // Count active timers
-        std::string count_str = exec_command("systemctl --user list-units 'proton-drive-job-*.timer' --state=active --no-legend 2>/dev/null | wc -l");
-        count_str.erase(0, count_str.find_first_not_of(" \t\n"));
-        count_str.erase(count_str.find_last_not_of(" \t\n") + 1);
-        
-        std::string status_text = "● Active (" + count_str + " sync jobs)";
+    if (active_jobs > 0) {
+        std::string status_text = "● Active (" + std::to_string(active_jobs) + " sync jobs)";
         gtk_label_set_text(GTK_LABEL(service_status_label_), status_text.c_str());
         gtk_widget_add_css_class(service_status_label_, "service-status-active");
         gtk_widget_set_sensitive(start_btn_, FALSE);
@@ -840,6 +840,7 @@ void AppWindow::show_sync_job_delete_confirm(const std::string& job_id, const st
         
         conf->self->refresh_sync_jobs();
         conf->self->refresh_cloud_files();
+        conf->self->poll_status(true);  // Job timer removed: refresh service status now
         gtk_window_destroy(GTK_WINDOW(conf->dialog));
     }), dialog);
     
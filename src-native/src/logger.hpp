@@ -19,6 +19,9 @@ public:
     static void info(const std::string& message) { log(LogLevel::INFO, message); }
     static void warn(const std::string& message) { log(LogLevel::WARN, message); }
     static void error(const std::string& message) { log(LogLevel::ERROR, message); }
+    
+    // Check before building expensive messages that may be filtered out
+    static bool is_enabled(LogLevel level) { return level >= current_level; }
 
 private:
     static LogLevel current_level;
@@ -262,12 +262,15 @@ bool check_dependencies(std::vector<std::string>& missing_deps, std::vector<std:
         all_ok = false;
         Logger::error("[Dependency] CRITICAL: rclone not found in PATH");
     } else {
-        // Check rclone version
-        FILE* pipe = popen("rclone version 2>&1 | head -1", "r");
+        // Check rclone version (fgets already stops at the first line, so no
+        // extra `head` process is needed; the short banner fits the pipe buffer)
+        FILE* pipe = popen("rclone version 2>&1", "r");
         if (pipe) {
             char buffer[256];
             if (fgets(buffer, sizeof(buffer), pipe) != nullptr) {
-                Logger::info("[Dependency] Found: " + std::string(buffer));
+                std::string version_line(buffer);
+                if (!version_line.empty() && version_line.back() == '\n') version_line.pop_back();
+                Logger::info("[Dependency] Found: " + version_line);
             }
             pclose(pipe);
         }